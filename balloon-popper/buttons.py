@@ -2,11 +2,11 @@
 Buttons module for balloon popping game.
 """
 
-import json
 import socket
 import arcade
 import arcade.gui
 import network
+import server_message as sm
 from constants import WINDOW_WIDTH, WINDOW_HEIGHT
 from player import claim_player_color
 
@@ -24,80 +24,76 @@ def tint(color: arcade.types.RGBA255, scalar: int) -> arcade.types.RGBA255:
     )
 
 
+# Color button layout, which is the same for every button
+COLOR_BUTTON_SIZE = min(WINDOW_HEIGHT, WINDOW_WIDTH) * 0.3
+COLOR_BUTTON_PADDING = 10
+COLOR_BUTTON_LEFT_X = WINDOW_WIDTH // 2 - COLOR_BUTTON_SIZE - COLOR_BUTTON_PADDING
+COLOR_BUTTON_RIGHT_X = WINDOW_WIDTH // 2 + COLOR_BUTTON_PADDING
+COLOR_BUTTON_UP_Y = WINDOW_HEIGHT // 2 + COLOR_BUTTON_PADDING
+COLOR_BUTTON_BOTTOM_Y = WINDOW_HEIGHT // 2 - COLOR_BUTTON_SIZE - COLOR_BUTTON_PADDING
+
+# The (x, y, button color) of the button for each player color
+COLOR_BUTTON_LAYOUT: dict[str, tuple[float, float, arcade.types.RGBA255]] = {
+    'red': (COLOR_BUTTON_LEFT_X, COLOR_BUTTON_UP_Y, arcade.color.RED_ORANGE),
+    'green': (COLOR_BUTTON_RIGHT_X, COLOR_BUTTON_UP_Y, arcade.color.GO_GREEN),
+    'yellow': (COLOR_BUTTON_LEFT_X, COLOR_BUTTON_BOTTOM_Y, arcade.color.CYBER_YELLOW),
+    'pink': (COLOR_BUTTON_RIGHT_X, COLOR_BUTTON_BOTTOM_Y, arcade.color.PINK_LAVENDER),
+}
+
+# Color button font details
+COLOR_BUTTON_FONT_SIZE = 16
+COLOR_BUTTON_FONT_NAME = 'arial'
+COLOR_BUTTON_FONT_COLOR = arcade.color.BLACK
+COLOR_BUTTON_BORDER_WIDTH = 0
+
+
 class ColorButton(arcade.gui.UIFlatButton):
     """
     Button for picking player color.
     """
     def __init__(self, color: str, client_socket: socket.socket):
-        size = min(WINDOW_HEIGHT, WINDOW_WIDTH) * 0.3
-        button_width = size
-        button_height = size
-        padding = 10
-        left_x = WINDOW_WIDTH // 2 - button_width - padding
-        right_x = WINDOW_WIDTH // 2 + padding
-        up_y = WINDOW_HEIGHT // 2 + padding
-        bottom_y = WINDOW_HEIGHT // 2 - button_height - padding
-        font_size=16
-        font_name='arial'
-        font_color=arcade.color.BLACK
-        border_width=0
+        try:
+            x, y, button_color = COLOR_BUTTON_LAYOUT[color]
+        except KeyError:
+            raise ValueError('Invalid player color for button!') from None
         self.color = color
         self.client_socket = client_socket
         self.claimed: bool = False
-        match color:
-            case 'red':
-                x = left_x
-                y = up_y
-                button_color = arcade.color.RED_ORANGE
-            case 'green':
-                x = right_x
-                y = up_y
-                button_color = arcade.color.GO_GREEN
-            case 'yellow':
-                x = left_x
-                y = bottom_y
-                button_color = arcade.color.CYBER_YELLOW
-            case 'pink':
-                x = right_x
-                y = bottom_y
-                button_color = arcade.color.PINK_LAVENDER
-            case _:
-                raise ValueError('Invalid player color for button!')
         button_style = {
             'normal': arcade.gui.UIFlatButton.UIStyle(
-                font_size=font_size,
-                font_name=font_name,
-                font_color=font_color,
-                border_width=border_width,
+                font_size=COLOR_BUTTON_FONT_SIZE,
+                font_name=COLOR_BUTTON_FONT_NAME,
+                font_color=COLOR_BUTTON_FONT_COLOR,
+                border_width=COLOR_BUTTON_BORDER_WIDTH,
                 bg=button_color
             ),
             'hover': arcade.gui.UIFlatButton.UIStyle(
-                font_size=font_size,
-                font_name=font_name,
-                font_color=font_color,
-                border_width=border_width,
+                font_size=COLOR_BUTTON_FONT_SIZE,
+                font_name=COLOR_BUTTON_FONT_NAME,
+                font_color=COLOR_BUTTON_FONT_COLOR,
+                border_width=COLOR_BUTTON_BORDER_WIDTH,
                 bg=tint(button_color, 1.5)
             ),
             'press': arcade.gui.UIFlatButton.UIStyle(
-                font_size=font_size,
-                font_name=font_name,
-                font_color=font_color,
-                border_width=border_width,
+                font_size=COLOR_BUTTON_FONT_SIZE,
+                font_name=COLOR_BUTTON_FONT_NAME,
+                font_color=COLOR_BUTTON_FONT_COLOR,
+                border_width=COLOR_BUTTON_BORDER_WIDTH,
                 bg=tint(button_color, 0.5)
             ),
             'disabled': arcade.gui.UIFlatButton.UIStyle(
-                font_size=font_size,
-                font_name=font_name,
-                font_color=font_color,
-                border_width=border_width,
+                font_size=COLOR_BUTTON_FONT_SIZE,
+                font_name=COLOR_BUTTON_FONT_NAME,
+                font_color=COLOR_BUTTON_FONT_COLOR,
+                border_width=COLOR_BUTTON_BORDER_WIDTH,
                 bg=arcade.color.GRAY_ASPARAGUS
             ),
         }
         super().__init__(
             x=x,
             y=y,
-            width=button_width,
-            height=button_height,
+            width=COLOR_BUTTON_SIZE,
+            height=COLOR_BUTTON_SIZE,
             text=f'Player {self.color}',
             style=button_style
         )
@@ -127,8 +123,9 @@ class ConfirmButton(arcade.gui.UIFlatButton):
         self.client_socket = client_socket
 
     def on_click(self, event: arcade.gui.UIOnClickEvent) -> None:
+        # The game start has already been confirmed
+        if self.disabled:
+            return
         # Send start confirm message
-        confirm_message = {'action': 'CONFIRM START'}
-        confirm_message_json = json.dumps(confirm_message)
-        network.send_message(self.client_socket, confirm_message_json)
+        network.send_message(self.client_socket, sm.confirm_start_msg())
         self.disabled = True
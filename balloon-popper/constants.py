@@ -1,20 +1,22 @@
 """
 Constants for balloon popping game.
 """
+import os
+from typing import Final
 from arcade import Texture, load_texture, color
 from arcade.types import Color
 
 # Window constants
 # Window and padding
-WINDOW_WIDTH = 1280
-WINDOW_HEIGHT = 720
-MARGIN = 20
-WINDOW_TITLE = "Popping Balloons!"
+WINDOW_WIDTH: Final = 1280
+WINDOW_HEIGHT: Final = 720
+MARGIN: Final = 20
+WINDOW_TITLE: Final = "Popping Balloons!"
 
 
 # Balloon constants
 # Balloon textures corresponding to each player
-BALLOON_TEXTURES: dict[str, Texture] = {
+BALLOON_TEXTURES: Final[dict[str, Texture]] = {
     'red': load_texture('balloon-1.png'),
     'green': load_texture('balloon-2.png'),
     'yellow': load_texture('balloon-3.png'),
@@ -22,10 +24,10 @@ BALLOON_TEXTURES: dict[str, Texture] = {
 }
 
 # Score reward for popping balloon
-BALLOON_POP_REWARD = 10
+BALLOON_POP_REWARD: Final = 10
 
 # Score positions in top-left, top-right, bottom-left, bottom-right order
-SCORE_POSITIONS: dict[str, tuple[int, int, str, str]] = {
+SCORE_POSITIONS: Final[dict[str, tuple[int, int, str, str]]] = {
     'red': (MARGIN, WINDOW_HEIGHT - MARGIN, "left", "top"),
     'green': (WINDOW_WIDTH - MARGIN, WINDOW_HEIGHT - MARGIN, "right", "top"),
     'yellow': (MARGIN, MARGIN, "left", "bottom"), 
@@ -33,7 +35,7 @@ SCORE_POSITIONS: dict[str, tuple[int, int, str, str]] = {
 }
 
 # The arcade color for each player
-SCORE_COLORS: dict[str, Color] = {
+SCORE_COLORS: Final[dict[str, Color]] = {
     'red': color.RED,
     'green': color.GREEN,
     'yellow': color.YELLOW,
@@ -41,21 +43,26 @@ SCORE_COLORS: dict[str, Color] = {
 }
 
 # Player information
-MIN_PLAYERS = 2
-MAX_PLAYERS = 4
-PLAYER_COLORS = ('red', 'green', 'yellow', 'pink')
+MIN_PLAYERS: Final = 2
+MAX_PLAYERS: Final = 4
+PLAYER_COLORS: Final = ('red', 'green', 'yellow', 'pink')
 
 # Socket connection constants
-IP = '127.0.0.1'
-PORT = 55555
-MAX_CONNECTIONS = 4
+IP: Final = '127.0.0.1'
+PORT: Final = 55555
+MAX_CONNECTIONS: Final = 4
 
 # Network frame details
-HEADER_SIZE = 8
-BYTE_ORDER = 'big'
-DEFAULT_ENCODING = 'utf-8'
-MAX_SIZE = 4096
+HEADER_SIZE: Final = 8
+BYTE_ORDER: Final = 'big'
+DEFAULT_ENCODING: Final = 'utf-8'
+MAX_SIZE: Final = 4096
 
 # Server game loop details
-TICK_DURATION = 0.1
-BALLOON_SPAWN_INTERVAL = 0.5
+TICK_DURATION: Final = 0.1
+BALLOON_SPAWN_INTERVAL: Final = 0.5
+
+# Debugging details
+# Enables logging of per-message and per-balloon events in the hot loops,
+# opt-in by setting the BALLOON_DEBUG environment variable to 1, true or yes
+DEBUG: Final = os.environ.get('BALLOON_DEBUG', '').strip().lower() in ('1', 'true', 'yes')
@@ -3,10 +3,16 @@ Network utilities for transmission of the Balloon Popping game data.
 """
 
 import socket
-from queue import Queue
+import struct
+from queue import SimpleQueue, Empty
 from exceptions import FrameError
 from constants import HEADER_SIZE, MAX_SIZE, BYTE_ORDER, DEFAULT_ENCODING, IP, PORT, MAX_CONNECTIONS
 
+# Precompiled codec for the frame header, an unsigned integer of HEADER_SIZE bytes in BYTE_ORDER
+_HEADER_STRUCT = struct.Struct(
+    {'big': '>', 'little': '<'}[BYTE_ORDER] + {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}[HEADER_SIZE]
+)
+
 def make_server_socket() -> socket.socket:
     """Prepares a server socket object with a TCP stream."""
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -14,22 +20,38 @@ def make_server_socket() -> socket.socket:
     server_socket.listen(MAX_CONNECTIONS)
     return server_socket
 
+def _disable_nagle(sock: socket.socket) -> None:
+    """
+    Disables Nagle's algorithm on a TCP socket.
+    Game frames are small and time-sensitive, so they should be sent right away
+    instead of being held back until previously sent data is acknowledged.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
 def make_client_socket() -> socket.socket:
     """Prepares a client socket in order to communicate with the server via TCP."""
     client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    _disable_nagle(client_socket)
     client_socket.connect((IP, PORT))
     return client_socket
 
+def accept_client(server_socket: socket.socket) -> tuple[socket.socket, tuple[str, int]]:
+    """Accepts a new client connection on the server socket, prepared for sending game frames."""
+    client_socket, client_address = server_socket.accept()
+    _disable_nagle(client_socket)
+    return client_socket, client_address
+
 def _length_from_header(buffer: bytes) -> int | None:
     """
     Reads the byte length retrieved from the first header in the read frame 
     into an integer if it exists, or None otherwise.
-    Rejects header sizes of length over 4096.
+    Returns None for buffers shorter than a header or longer than MAX_SIZE bytes;
+    the length read from the header itself is not checked here.
     """
     if len(buffer) < HEADER_SIZE or len(buffer) > MAX_SIZE:
         return None
 
-    length = int.from_bytes(buffer[:HEADER_SIZE], BYTE_ORDER, signed=False)
+    (length,) = _HEADER_STRUCT.unpack_from(buffer)
     return length
 
 def is_message(buffer: bytes) -> bool:
@@ -47,74 +69,40 @@ def _pack_header(message_length: int) -> bytes:
     """
     if message_length <= 0:
         raise ValueError('The header must have a positive message length!')
-    return message_length.to_bytes(HEADER_SIZE, BYTE_ORDER)
+    return _HEADER_STRUCT.pack(message_length)
 
 def _pack_message(data: str) -> bytes:
     """Packs the buffer to be read as a frame into bytes, from a given string."""
     message = data.encode(DEFAULT_ENCODING)
     return _pack_header(len(message)) + message
 
-def _unpack_header(buffer: bytes) -> int | None:
-    """Unpacks the message length from the header and returns it, or None if this does not exist."""
-    return _length_from_header(buffer)
-
-def _unpack_message(buffer: bytes) -> str | None:
-    """Returns a full decoded message if it exists, otherwise it returns None."""
-    length = _length_from_header(buffer)
-    if length is None:
-        return None
-    end = HEADER_SIZE + length
-    if len(buffer) < end:
-        return None
-    message = buffer[HEADER_SIZE:end]
-    return message.decode(DEFAULT_ENCODING)
-
-def _unpack_buffer(buffer: bytes) -> tuple[int, str] | None:
-    """
-    Unpacks a complete message buffer into (length, message).
-    Returns None if the message frame was incomplete.
-    """
-    length = _length_from_header(buffer)
-    if length is None:
-        return None
-    end = HEADER_SIZE + length
-    if len(buffer) < end:
-        return None
-    message = buffer[HEADER_SIZE:end].decode(DEFAULT_ENCODING)
-    return (length, message)
-
-def _recvall(src: socket.socket, length: int) -> bytes:
+def _recvall(src: socket.socket, length: int) -> bytearray:
     """
     Receives specified amount of bytes from socket, ensuring full data transmission.
     The point is to replicate the behavior of socket.socket.sendall(), but for receiving data
-    instead.
+    instead. The length must already be checked against MAX_SIZE.
     """
-    chunks = []
-    remaining = length
-    while remaining > 0:
-        chunk = src.recv(remaining)
-        if not chunk:
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    received = 0
+    while received < length:
+        count = src.recv_into(view[received:], length - received)
+        if count == 0:
             raise RuntimeError('Connection closed during byte read!')
-        chunks.append(chunk)
-        remaining -= len(chunk)
-    return b''.join(chunks)
-
-def _recv_buffer(src: socket.socket) -> bytes:
-    """Reads a full message frame from socket (header and message)."""
-    header = _recvall(src, HEADER_SIZE)
-    length = _length_from_header(header)
-    if length is None:
-        raise ValueError('Could not read frame length from header!')
-    message = _recvall(src, length)
-    return header + message
+        received += count
+    return buffer
 
 def recv_and_unpack(src: socket.socket) -> tuple[int, str]:
-    """Reads a full message frame and unpacks it in (header, message) form."""
-    buffer = _recv_buffer(src)
-    output = _unpack_buffer(buffer)
-    if output is None:
-        raise FrameError('Complete frame read failed!')
-    return output
+    """
+    Reads a full message frame and unpacks it in (message length, message) form.
+    Raises FrameError if the frame would be longer than MAX_SIZE bytes.
+    """
+    (length,) = _HEADER_STRUCT.unpack(_recvall(src, HEADER_SIZE))
+    # Frames (header and message) may not be longer than MAX_SIZE bytes
+    if length > MAX_SIZE - HEADER_SIZE:
+        raise FrameError(f'Frame message length {length} exceeds the maximum frame size of {MAX_SIZE} bytes!')
+    message = _recvall(src, length)
+    return (length, message.decode(DEFAULT_ENCODING))
 
 def send_message(dest: socket.socket, message: str) -> None:
     """Sends a message frame to a destination socket in expected format."""
@@ -127,31 +115,37 @@ def broadcast_message(dest: list[socket.socket], message: str) -> None:
     for client_socket in dest:
         client_socket.sendall(frame)
 
-def recv_into_queue(client_socket: socket.socket, message_queue: Queue) -> None:
+def broadcast_messages(dest: list[socket.socket], messages: list[str]) -> None:
+    """
+    Broadcasts several messages to a collection of sockets.
+    The frames are packed together, so each socket receives all of them in a single write.
+    """
+    frames = b''.join(_pack_message(message) for message in messages)
+    for client_socket in dest:
+        client_socket.sendall(frames)
+
+def recv_into_queue(client_socket: socket.socket, message_queue: SimpleQueue) -> None:
     """
-    Receives incoming frames into a message queue.
+    Receives incoming frames into a message queue, as decoded message strings.
     This function is designed to always run on a separate thread, daemonized
     (as to only close when the whole program exits)
     example: threading.Thread(target=recv_into_queue, args=(client_socket, message_queue), daemon=True).start()
     """
     try:
         while True:
-            frame = recv_and_unpack(client_socket)
-            message_queue.put(frame)
+            _, message = recv_and_unpack(client_socket)
+            message_queue.put(message)
     except FrameError as e:
         print(e)
 
-def poll_from_queue(message_queue: Queue, callback, server_state = None, thread_cond = None) -> None:
+def poll_from_queue(message_queue: SimpleQueue, callback, server_state = None, thread_cond = None) -> None:
     """Calls callback on every message from the queue, until it's fully drained."""
+    # The extra callback arguments are the same for every message, so they are resolved once
+    extra_args = tuple(arg for arg in (server_state, thread_cond) if arg is not None)
+    get_message = message_queue.get_nowait
     while True:
-        if message_queue.empty():
+        try:
+            message = get_message()
+        except Empty:
             break
-        _, message = message_queue.get_nowait()
-        if server_state is not None and thread_cond is not None:
-            callback(message, server_state, thread_cond)
-        elif server_state is not None:
-            callback(message, server_state)
-        elif thread_cond is not None:
-            callback(message, thread_cond)
-        else:
-            callback(message)
+        callback(message, *extra_args)
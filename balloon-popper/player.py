@@ -24,6 +24,8 @@ class Score(arcade.Text):
         )
         self._score = 0
         self.text = f'Score: {self._score}'
+        # The last text rendered by the label
+        self._shown_text = self.text
         self.color = color
         self.font_size: int = 14
 
@@ -51,7 +53,11 @@ class Score(arcade.Text):
 
     def update(self) -> None:
         """Updates the score label with the current score number."""
-        self.text = self.score_text()
+        text = self.score_text()
+        if text == self._shown_text:
+            return
+        self._shown_text = text
+        self.text = text
 
 class Balloon(arcade.Sprite):
     """Balloon class for Player."""
@@ -64,11 +70,18 @@ class Balloon(arcade.Sprite):
         self.center_y = center_y
         self.scale: float = 0.5
         self.velocity_y: int = 80
+        # Height above which the balloon is considered out of bounds
+        texture_size_x, _ = self.texture.size
+        self.out_of_bounds_y: int = ct.WINDOW_HEIGHT + texture_size_x
 
 class BalloonManager:
     """Balloon manager class"""
+    __slots__ = ('_balloons', '_balloons_by_id', '_current_player', 'client_socket')
+
     def __init__(self, current_player: str, client_socket: socket.socket):
         self._balloons: arcade.SpriteList = arcade.SpriteList()
+        # The same balloons, indexed by their id
+        self._balloons_by_id: dict[str, Balloon] = {}
         self._current_player = current_player
         self.client_socket = client_socket
 
@@ -79,36 +92,49 @@ class BalloonManager:
 
     def add(self, balloon_id: str, player_color: str, x: int, y: int):
         """Adds a balloon object by given id, color and position"""
-        self._balloons.append(Balloon(balloon_id, player_color, x, y))
+        balloon = Balloon(balloon_id, player_color, x, y)
+        self._balloons.append(balloon)
+        self._balloons_by_id[balloon_id] = balloon
 
     def get_balloon_by_id(self, balloon_id: str) -> Balloon:
         """Returns a reference to a balloon by id"""
-        for balloon in self._balloons:
-            if balloon.balloon_id == balloon_id:
-                return balloon
-
-    def remove_by_id(self, balloon_id: int) -> None:
-        """Removes a balloon by id"""
-        for balloon in self._balloons:
-            if balloon.balloon_id == balloon_id:
-                self._balloons.remove(balloon)
-                break
+        return self._balloons_by_id.get(balloon_id)
+
+    def _remove(self, balloon: Balloon) -> None:
+        """Removes a balloon from both the sprite list and the id index."""
+        self._balloons.remove(balloon)
+        del self._balloons_by_id[balloon.balloon_id]
+
+    def remove_by_id(self, balloon_id: str) -> None:
+        """
+        Removes a balloon by id.
+        Does nothing if the balloon was already removed (e.g. popped locally).
+        """
+        balloon = self._balloons_by_id.get(balloon_id)
+        if balloon is not None:
+            self._remove(balloon)
 
     def pop_top(self, position: tuple[float, float]) -> bool:
-        """Pops the balloon at the top-most layer where the player clicked."""
-        x, y = position
-        balloons_clicked = arcade.get_sprites_at_point((x, y), self._balloons)
-        if len(balloons_clicked) > 0:
-            # Get the last drawn balloon
-            balloon_to_remove = balloons_clicked[-1]
-
-            # Prepare balloon data for sending to server
-            balloon_data_json = sm.balloon_pop_msg(balloon_to_remove.balloon_id, self.current_player)
-            network.send_message(self.client_socket, balloon_data_json)
-
+        """
+        Pops the balloon at the top-most layer where the player clicked.
+        Returns whether a balloon was popped.
+        """
+        balloons_clicked = arcade.get_sprites_at_point(position, self._balloons)
+        if not balloons_clicked:
+            return False
+
+        # Get the last drawn balloon
+        balloon_to_remove = balloons_clicked[-1]
+
+        # Prepare balloon data for sending to server
+        balloon_data_json = sm.balloon_pop_msg(balloon_to_remove.balloon_id, self._current_player)
+        network.send_message(self.client_socket, balloon_data_json)
+
+        if ct.DEBUG:
             print(f'Sent BALLOON POP message for {balloon_to_remove.balloon_id} to server!')
-            # Remove the last drawn balloon
-            self._balloons.remove(balloons_clicked[-1])
+        # Remove the last drawn balloon
+        self._remove(balloon_to_remove)
+        return True
 
     def draw(self) -> None:
         """Draw method"""
@@ -116,19 +142,25 @@ class BalloonManager:
 
     def update(self, delta_time: float) -> None:
         """Update method"""
-        # Raise all of the balloons
+        # Raise all of the balloons, collecting the ones that went out of bounds
+        out_of_bounds: list[Balloon] = []
         for balloon in self._balloons:
             balloon.center_y += balloon.velocity_y * delta_time
-            # If the balloon goes out of bounds, remove it
-            texture_size_x, _ = ct.BALLOON_TEXTURES[balloon.player_color].size
-            if balloon.center_y - texture_size_x > ct.WINDOW_HEIGHT:
-                out_of_bounds_msg_json = sm.balloon_out_of_bounds_msg(balloon.balloon_id)
-                network.send_message(self.client_socket, out_of_bounds_msg_json)
+            if balloon.center_y > balloon.out_of_bounds_y:
+                out_of_bounds.append(balloon)
+
+        # Remove them after iterating, so that no balloon gets skipped
+        for balloon in out_of_bounds:
+            out_of_bounds_msg_json = sm.balloon_out_of_bounds_msg(balloon.balloon_id)
+            network.send_message(self.client_socket, out_of_bounds_msg_json)
+            if ct.DEBUG:
                 print(f'Sent BALLOON OUT OF BOUNDS message for {balloon.balloon_id}!')
-                self._balloons.remove(balloon)
+            self._remove(balloon)
 
 class Player:
     """Player class."""
+    __slots__ = ('_player_color', '_score', '_score_position')
+
     def __init__(self, player_color: str):
         if player_color not in ct.PLAYER_COLORS:
             raise InvalidPlayerException(f'Player {player_color} is an invalid player color!')
@@ -159,8 +191,11 @@ class Player:
 
 class PlayerFactory:
     """Player factory"""
+    __slots__ = ('_players',)
+
     def __init__(self):
-        self._players: list[Player] = []
+        # Players indexed by their color
+        self._players: dict[str, Player] = {}
 
     def add(self, color: str) -> Player:
         """Adds a new player to the game."""
@@ -169,23 +204,21 @@ class PlayerFactory:
         if color not in ct.PLAYER_COLORS:
             raise ValueError('Cannot add player of invalid color!')
         player = Player(color)
-        self._players.append(player)
+        self._players[color] = player
         return player
 
     def get_player_by_color(self, color: str) -> Player:
         """Returns reference to player by player color."""
-        for player in self._players:
-            if player.player_color == color:
-                return player
+        return self._players.get(color)
 
     def draw(self) -> None:
         """Draws all of the players."""
-        for player in self._players:
+        for player in self._players.values():
             player.draw()
 
     def update(self) -> None:
         """Updates all of the players."""
-        for player in self._players:
+        for player in self._players.values():
             player.update()
 
 def claim_player_color(server_socket: socket.socket, player_color: str) -> bool:
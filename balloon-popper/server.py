@@ -8,15 +8,15 @@ import json
 import time
 import queue
 import random
-import uuid
+import itertools
 from dataclasses import dataclass, field
 import network
 import constants as ct
-from player import Score, Balloon
+from player import Score
 from exceptions import InvalidPlayerException, UndefinedMessageException
 import server_message as sm
 
-@dataclass
+@dataclass(slots=True)
 class PlayerConnections:
     """Class for storing active player connections."""
     red: tuple | None = None
@@ -28,20 +28,14 @@ class PlayerConnections:
         return len(self.connected_colors)
 
     @property
-    def connected_colors(self) -> tuple[str]:
+    def connected_colors(self) -> tuple[str, ...]:
         """Returns a tuple consisting of the connected players' colors."""
         return tuple(color for color in ct.PLAYER_COLORS if getattr(self, color) is not None)
     
     @property
-    def sockets(self) -> tuple[socket.socket]:
+    def sockets(self) -> tuple[socket.socket, ...]:
         """Returns the sockets for the connected players."""
-        active_sockets = []
-        for color in ct.PLAYER_COLORS:
-            result = getattr(self, color)
-            if result is not None:
-                sock, _ = result
-                active_sockets.append(sock)
-        return tuple(active_sockets)
+        return tuple(getattr(self, color)[0] for color in self.connected_colors)
 
     def socket_for(self, color: str) -> socket.socket:
         """Returns the socket object for the specified player color."""
@@ -60,53 +54,83 @@ class PlayerConnections:
             return
         raise ValueError(f'Player {color} has already been assigned a connection!')
 
-@dataclass
+@dataclass(slots=True)
 class PlayerScores:
-    """Class for storing the players' scores"""
-    red: int = 0
-    green: int = 0
-    yellow: int = 0
-    pink: int = 0
+    """Class for storing the players' scores, keyed by player color."""
+    scores: dict[str, int] = field(default_factory=lambda: dict.fromkeys(ct.PLAYER_COLORS, 0))
 
     def score_for(self, color: str) -> int:
-        """Returns the score object for the specified player color."""
-        result = getattr(self, color)
-        if result is not None:
-            raise ValueError(f'Player color {color} does not exist, aborting request of player score.')
-        return result
+        """Returns the score for the specified player color."""
+        try:
+            return self.scores[color]
+        except KeyError:
+            raise ValueError(f'Player color {color} does not exist, aborting request of player score.') from None
     
     def increase_for(self, color: str) -> None:
         """Increases the score for a player (server side)."""
-        if color not in ct.PLAYER_COLORS:
-            raise ValueError(f'Player color {color} does not exist, cannot increase player score.')
-        setattr(self, color, Score.increase_amount(getattr(self, color)))
+        try:
+            self.scores[color] = Score.increase_amount(self.scores[color])
+        except KeyError:
+            raise ValueError(f'Player color {color} does not exist, cannot increase player score.') from None
 
     def decrease_for(self, color: str) -> None:
         """Decreases the score for a player (server side)."""
-        if color not in ct.PLAYER_COLORS:
-            raise ValueError(f'Player color {color} does not exist, cannot increase player score.')
-        setattr(self, color, Score.decrease_amount(getattr(self, color)))
+        try:
+            self.scores[color] = Score.decrease_amount(self.scores[color])
+        except KeyError:
+            raise ValueError(f'Player color {color} does not exist, cannot decrease player score.') from None
 
-@dataclass
+@dataclass(slots=True)
+class ServerBalloon:
+    """
+    Class for storing the data of a spawned balloon (server side).
+    The server only needs the data that gets sent to the players, not a drawable sprite.
+    """
+    balloon_id: str
+    player_color: str
+    center_x: int
+    center_y: int
+
+@dataclass(slots=True)
 class ServerState:
     """Server state class"""
     confirms: set[str] = field(default_factory=set)
-    active_balloons: list[Balloon] = field(default_factory=list)
+    # The currently spawned balloons, indexed by balloon id
+    active_balloons: dict[str, ServerBalloon] = field(default_factory=dict)
     assigned_players: PlayerConnections = field(default_factory=PlayerConnections)
     player_scores: PlayerScores = field(default_factory=PlayerScores)
     started: bool = False
 
-def create_random_balloon(color: str) -> Balloon:
-    """Creates a balloon object at a random position from a specified player color."""
-    # Prepare random balloon data
-    balloon_id = uuid.uuid4().hex
+def _spawn_bounds(color: str) -> tuple[int, int, int, int]:
+    """
+    Calculates the (min_x, max_x, min_y, max_y) area in which a balloon
+    of the specified player color can be spawned.
+    """
     balloon_size_x, balloon_size_y = ct.BALLOON_TEXTURES[color].size
     half_balloon_x: int = balloon_size_x // 2
     half_balloon_y: int = balloon_size_y // 2
     margin_x: int = ct.MARGIN * 3
-    random_x: int = random.randint(margin_x + half_balloon_x, ct.WINDOW_WIDTH - margin_x - half_balloon_x)
-    random_y: int = random.randint(half_balloon_y, ct.WINDOW_HEIGHT - half_balloon_y)
-    return Balloon(
+    return (
+        margin_x + half_balloon_x,
+        ct.WINDOW_WIDTH - margin_x - half_balloon_x,
+        half_balloon_y,
+        ct.WINDOW_HEIGHT - half_balloon_y
+    )
+
+# Source of balloon ids, unique for the lifetime of the server
+_balloon_ids = itertools.count()
+
+# The spawn area only depends on the balloon texture, so it is calculated once per color
+SPAWN_BOUNDS: dict[str, tuple[int, int, int, int]] = {color: _spawn_bounds(color) for color in ct.PLAYER_COLORS}
+
+def create_random_balloon(color: str) -> ServerBalloon:
+    """Creates a balloon object at a random position from a specified player color."""
+    # Prepare random balloon data
+    balloon_id = format(next(_balloon_ids), 'x')
+    min_x, max_x, min_y, max_y = SPAWN_BOUNDS[color]
+    random_x: int = random.randint(min_x, max_x)
+    random_y: int = random.randint(min_y, max_y)
+    return ServerBalloon(
         balloon_id,
         color,
         random_x,
@@ -116,47 +140,45 @@ def create_random_balloon(color: str) -> Balloon:
 def handle_game_message(message: str, state: ServerState, thread_cond: threading.Condition) -> None:
     """Handle incoming game messages from active players."""
     game_message = json.loads(message)
-    print('Received message from client!')
+    if ct.DEBUG:
+        print('Received message from client!')
     match game_message['action']:
         case 'BALLOON POP':
             balloon_id = game_message['balloon_id']
             player_color = game_message['popped_by']
+            # Remove the balloon and update the score in a single critical section
             with thread_cond:
                 assigned_player_sockets = state.assigned_players.sockets
-                for balloon in state.active_balloons:
-                    if balloon.balloon_id == balloon_id:
-                        balloon_color = balloon.player_color
-                        state.active_balloons.remove(balloon)
-                        break
-            # Broadcast to all players that the balloon should be removed
-            balloon_popped_json = sm.balloon_remove_msg(balloon_id)
-            network.broadcast_message(assigned_player_sockets, balloon_popped_json)
-            with thread_cond:
+                balloon = state.active_balloons.pop(balloon_id, None)
+                if balloon is None:
+                    # The balloon has already been popped or removed
+                    return
+                balloon_color = balloon.player_color
                 if player_color == balloon_color:
                     state.player_scores.increase_for(player_color)
                     score_message_json = sm.score_increase_msg(player_color)
                 else:
                     state.player_scores.decrease_for(player_color)
                     score_message_json = sm.score_decrease_msg(player_color)
-            network.broadcast_message(assigned_player_sockets, score_message_json)
+            balloon_popped_json = sm.balloon_remove_msg(balloon_id)
+            # Broadcast to all players that the balloon should be removed, along with the score change
+            network.broadcast_messages(assigned_player_sockets, [balloon_popped_json, score_message_json])
         case 'BALLOON OUT OF BOUNDS':
             balloon_id = game_message['balloon_id']
             with thread_cond:
                 assigned_player_sockets = state.assigned_players.sockets
-                for balloon in state.active_balloons:
-                    if balloon.balloon_id == balloon_id:
-                        # Broadcast to all players that the balloon should be removed
-                        state.active_balloons.remove(balloon)
-                        break
+                state.active_balloons.pop(balloon_id, None)
+            # Broadcast to all players that the balloon should be removed
             balloon_popped_json = sm.balloon_remove_msg(balloon_id)
             network.broadcast_message(assigned_player_sockets, balloon_popped_json)
         case _:
             raise UndefinedMessageException(f"Game message in game loop {game_message['action']} is undefined")
 
-def game_loop(state: ServerState, thread_cond: threading.Condition, pending_messages: queue.Queue) -> None:
+def game_loop(state: ServerState, thread_cond: threading.Condition, pending_messages: queue.SimpleQueue) -> None:
     """Game loop (server side)."""
-    next_tick = time.monotonic() + ct.TICK_DURATION
-    next_balloon_spawn = time.monotonic() + ct.BALLOON_SPAWN_INTERVAL
+    start_time = time.monotonic()
+    next_tick = start_time + ct.TICK_DURATION
+    next_balloon_spawn = start_time + ct.BALLOON_SPAWN_INTERVAL
     while True:
         time_now = time.monotonic()
 
@@ -172,8 +194,8 @@ def game_loop(state: ServerState, thread_cond: threading.Condition, pending_mess
                 with thread_cond:
                     random_ply_color = random.choice(state.assigned_players.connected_colors)
                     assigned_player_sockets = state.assigned_players.sockets
-                    new_balloon: Balloon = create_random_balloon(random_ply_color)
-                    state.active_balloons.append(new_balloon)
+                    new_balloon: ServerBalloon = create_random_balloon(random_ply_color)
+                    state.active_balloons[new_balloon.balloon_id] = new_balloon
 
                 # Send balloon data to players
                 balloon_data_json = sm.balloon_spawn_msg(
@@ -187,14 +209,6 @@ def game_loop(state: ServerState, thread_cond: threading.Condition, pending_mess
             delay = next_tick - time_now
             time.sleep(delay)
 
-def get_assigned_players(state: ServerState) -> list[socket.socket]:
-    """
-    Get connected clients from server state, for assigned players.
-    Must be in thread-safe context.
-    """
-    return [s for (s, _) in state.assigned_players.values()]
-
-
 def handle_client(client_socket: socket.socket, client_address: tuple[str, int], thread_cond: threading.Condition, state: ServerState) -> None:
     """Handle each client in a different thread."""
     # Inform the player about the currently occupied colors
@@ -266,7 +280,7 @@ def handle_client(client_socket: socket.socket, client_address: tuple[str, int],
         # Start the game
         print('Broadcasting game start!')
         network.broadcast_message(assigned_player_sockets, server_message_json)
-        pending_messages = queue.Queue()
+        pending_messages = queue.SimpleQueue()
         for ply_socket in assigned_player_sockets:
             threading.Thread(
                 target=network.recv_into_queue,
@@ -290,7 +304,7 @@ def main() -> None:
     server_state = ServerState()
 
     while True:
-        client_socket, client_address = server_socket.accept()
+        client_socket, client_address = network.accept_client(server_socket)
         print(f'Connection accepted from {client_address}')
         client_thread = threading.Thread(
             target=handle_client,
@@ -3,6 +3,14 @@ Module for available messages to be sent via sockets.
 """
 
 import json
+import functools
+
+# Separators without whitespace, for the most compact JSON message frames
+_SEPARATORS = (',', ':')
+
+def _dump(message: dict) -> str:
+    """Dumps a message dict into a compact JSON string."""
+    return json.dumps(message, separators=_SEPARATORS)
 
 def balloon_pop_msg(balloon_id: str, player_color: str) -> str:
     """Crafts a BALLOON POP message in JSON, and returns the dumped string."""
@@ -11,7 +19,7 @@ def balloon_pop_msg(balloon_id: str, player_color: str) -> str:
         'balloon_id': balloon_id,
         'popped_by': player_color,
     }
-    return json.dumps(message)
+    return _dump(message)
 
 def balloon_out_of_bounds_msg(balloon_id: str) -> str:
     """Crafts a BALLOON OUT OF BOUNDS message in JSON, and returns the dumped string."""
@@ -19,7 +27,7 @@ def balloon_out_of_bounds_msg(balloon_id: str) -> str:
         'action': 'BALLOON OUT OF BOUNDS',
         'balloon_id': balloon_id
     }
-    return json.dumps(message)
+    return _dump(message)
 
 def balloon_remove_msg(balloon_id: str) -> str:
     """Crafts a BALLOON REMOVE message in JSON, and returns the dumped string."""
@@ -27,7 +35,7 @@ def balloon_remove_msg(balloon_id: str) -> str:
         'action': 'BALLOON REMOVE',
         'balloon_id':balloon_id
     }
-    return json.dumps(message)
+    return _dump(message)
 
 def balloon_spawn_msg(balloon_id: str, color: str, center_x: str, center_y: str) -> str:
     """
@@ -41,7 +49,7 @@ def balloon_spawn_msg(balloon_id: str, color: str, center_x: str, center_y: str)
         'center_x': center_x,
         'center_y': center_y,
     }
-    return json.dumps(message)
+    return _dump(message)
 
 def color_pick_msg(color_pick: str) -> str:
     """Crafts a COLOR PICK message in JSON, and returns the dumped string."""
@@ -49,7 +57,7 @@ def color_pick_msg(color_pick: str) -> str:
         'action': 'COLOR PICK',
         'color': color_pick,
     }
-    return json.dumps(message)
+    return _dump(message)
 
 
 def colors_taken_msg(taken_colors: set[str], confirms: set[str]) -> str:
@@ -63,16 +71,23 @@ def colors_taken_msg(taken_colors: set[str], confirms: set[str]) -> str:
         'result': list(taken_colors),
         'confirms': len(confirms),
     }
-    return json.dumps(message)
+    return _dump(message)
+
+# Messages without any additional fields never change, so they are only dumped once
+_NEW_CONFIRM_MSG = _dump({'action': 'NEW CONFIRM'})
+_CONFIRM_START_MSG = _dump({'action': 'CONFIRM START'})
 
 def new_confirm_msg() -> str:
     """
-    Crafts a NEW CONFIRM message in JSON, and returns the dumped string.
+    Returns the NEW CONFIRM message in JSON, as a dumped string.
     """
-    message = {
-        'action': 'NEW CONFIRM',
-    }
-    return json.dumps(message)
+    return _NEW_CONFIRM_MSG
+
+def confirm_start_msg() -> str:
+    """
+    Returns the CONFIRM START message in JSON, as a dumped string.
+    """
+    return _CONFIRM_START_MSG
 
 def game_start_msg(claimed_colors: set[str]) -> str:
     """
@@ -83,8 +98,9 @@ def game_start_msg(claimed_colors: set[str]) -> str:
         'action':'GAME START',
         'claimed_colors': list(claimed_colors),
     }
-    return json.dumps(message)
+    return _dump(message)
 
+@functools.cache
 def score_increase_msg(player_color: str) -> str:
     """
     Crafts a SCORE INCREASE message in JSON, and returns the dumped string.
@@ -93,8 +109,9 @@ def score_increase_msg(player_color: str) -> str:
         'action': 'SCORE INCREASE',
         'player_color': player_color
     }
-    return json.dumps(message)
+    return _dump(message)
 
+@functools.cache
 def score_decrease_msg(player_color: str) -> str:
     """
     Crafts a SCORE decrease message in JSON, and returns the dumped string.
@@ -103,4 +120,4 @@ def score_decrease_msg(player_color: str) -> str:
         'action': 'SCORE DECREASE',
         'player_color': player_color
     }
-    return json.dumps(message)
+    return _dump(message)
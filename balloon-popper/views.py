@@ -85,6 +85,8 @@ class ConfirmLabel(arcade.Text):
         )
         self._start_confirms = 0
         self._player_count = 0
+        # The last text rendered by the label
+        self._shown_text = self.text
 
     @property
     def start_confirms(self) -> int:
@@ -101,10 +103,10 @@ class ConfirmLabel(arcade.Text):
         self._start_confirms += 1
         print('New game start confirm added to ConfirmLabel!')
 
-    def add_player(self) -> None:
-        """Increments a player counter internally."""
-        self._player_count += 1
-        print('New player added to ConfirmLabel!')
+    def set_counts(self, player_count: int, start_confirms: int) -> None:
+        """Raises the player and confirm counters to the given amounts in a single step."""
+        self._player_count = max(self._player_count, player_count)
+        self._start_confirms = max(self._start_confirms, start_confirms)
 
     def confirm_text(self) -> str:
         """Returns the expected string label."""
@@ -112,7 +114,11 @@ class ConfirmLabel(arcade.Text):
 
     def update(self) -> None:
         """Update method"""
-        self.text = self.confirm_text()
+        text = self.confirm_text()
+        if text == self._shown_text:
+            return
+        self._shown_text = text
+        self.text = text
 
 class PlayerChoiceView(arcade.View):
     """
@@ -151,7 +157,7 @@ class PlayerChoiceView(arcade.View):
         self.player_count = 0
         self.start_confirms = 0
 
-        self.pending_messages = queue.Queue()
+        self.pending_messages = queue.SimpleQueue()
 
     def on_show_view(self):
         self.background_color = arcade.csscolor.CORNSILK
@@ -180,15 +186,7 @@ class PlayerChoiceView(arcade.View):
         message = json.loads(message_json)
         match message['action']:
             case 'COLORS TAKEN':
-                result = set(message['result'])
-                confirms = message['confirms']
-                self.player_count = len(result)
-                self.start_confirms = confirms
-                self.update_confirm_label()
-                for color_button in self.color_buttons:
-                    if color_button.color in result:
-                        print(f'Disabled {color_button.color}!')
-                        color_button.disabled = True
+                self._apply_colors_taken(message)
             case 'NEW CONFIRM':
                 self.start_confirms += 1
                 self.confirm_label.add_confirm()
@@ -204,13 +202,20 @@ class PlayerChoiceView(arcade.View):
         message = json.loads(message_json)
         if message['action'] != 'COLORS TAKEN':
             raise UndefinedMessageException(f"COLORS TAKEN message expected, instead got {message['action']}")
+        self._apply_colors_taken(message)
+
+    def _apply_colors_taken(self, message: dict) -> None:
+        """
+        Updates the player and confirm counts from a decoded COLORS TAKEN message
+        and disables the buttons of the claimed colors.
+        """
         claimed_colors = set(message['result'])
-        confirms = message['confirms']
         self.player_count = len(claimed_colors)
-        self.start_confirms = confirms
+        self.start_confirms = message['confirms']
         self.update_confirm_label()
         for color_button in self.color_buttons:
-            if color_button.color in claimed_colors:
+            # Buttons that are already disabled don't need to be re-rendered
+            if color_button.color in claimed_colors and not color_button.disabled:
                 print(f'Disabled {color_button.color}!')
                 color_button.disabled = True
 
@@ -220,14 +225,7 @@ class PlayerChoiceView(arcade.View):
         if changes have occurred
         """
         # Update the confirm label if needed
-        diff = self.player_count - self.confirm_label.player_count
-        if diff > 0:
-            for _ in range(diff):
-                self.confirm_label.add_player()
-        diff = self.start_confirms - self.confirm_label.start_confirms
-        if diff > 0:
-            for _ in range(diff):
-                self.confirm_label.add_confirm()
+        self.confirm_label.set_counts(self.player_count, self.start_confirms)
     
     def disable_color_buttons(self) -> None:
         """Disables all color buttons."""
@@ -250,14 +248,13 @@ class PlayerChoiceView(arcade.View):
                     break
         if self.game_started and self.claimed_colors is not None:
             # Get current player
-            window = arcade.get_window()
             game_view = GameView(
                 self.claimed_colors,
                 self.current_player,
                 self.pending_messages,
                 self.client_socket
             )
-            window.show_view(game_view)
+            self.window.show_view(game_view)
         # Respond to incoming server messages
         network.poll_from_queue(self.pending_messages, self.handle_join_and_confirm)
         self.confirm_label.update()
@@ -267,7 +264,7 @@ class GameView(arcade.View):
     Game class.
     """
 
-    def __init__(self, claimed_colors: set[str], current_player: str, pending_messages: queue.Queue, client_socket: socket.socket):
+    def __init__(self, claimed_colors: set[str], current_player: str, pending_messages: queue.SimpleQueue, client_socket: socket.socket):
         super().__init__()
         self.background_color = arcade.csscolor.WHITE
         self.player_factory = PlayerFactory()